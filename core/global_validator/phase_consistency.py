@@ -14,21 +14,30 @@ Validates:
 Mismatch → FAIL (fail-closed).
 """
 
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Optional
 from .validator import Violation, ViolationSeverity, ValidationResult
 
+# Canonical status literals, interned so the hot comparisons below can use
+# pointer identity instead of character-by-character equality.
+_IMPLEMENTED = sys.intern('IMPLEMENTED')
+_NOT_IMPLEMENTED = sys.intern('NOT_IMPLEMENTED')
+
 
 class PhaseConsistencyChecker:
     """Checks phase status consistency."""
-    
+
     def __init__(self, validator):
         self.validator = validator
-    
+        self._phase_readmes: Dict[int, Path] = {}
+        self._systemd_units: List[str] = []
+
     def validate(self) -> ValidationResult:
         """Run phase consistency checks."""
         violations: List[Violation] = []
-        
+
         if not self.validator.guardrails:
             return ValidationResult(
                 passed=False,
@@ -38,163 +47,224 @@ class PhaseConsistencyChecker:
                     message="guardrails.yaml not loaded",
                 )]
             )
-        
+
         allowed_phases = self.validator.guardrails.get('allowed_phases', [])
-        
-        for phase in allowed_phases:
-            phase_id = phase.get('id')
-            phase_name = phase.get('name', 'Unknown')
-            status = phase.get('status')
-            phase_path_str = phase.get('path')
-            installable = phase.get('installable', False)
-            runnable = phase.get('runnable', False)
-            
-            if not phase_path_str:
+
+        # Snapshot the README index and unit list once per run instead of
+        # chasing validator attributes from every per-phase check.
+        self._phase_readmes = self.validator.phase_readmes
+        self._systemd_units = self.validator.systemd_units
+
+        # Per-phase work is independent and dominated by stat/README I/O,
+        # so fan it out over a small thread pool. executor.map preserves
+        # the phase order, keeping violation output deterministic.
+        if len(allowed_phases) > 1:
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                for phase_violations in executor.map(self._check_phase, allowed_phases):
+                    violations.extend(phase_violations)
+        else:
+            for phase in allowed_phases:
+                violations.extend(self._check_phase(phase))
+
+        # Check for phases that exist on disk but not in guardrails (orphaned)
+        # This is harder - we'd need to scan all directories and match
+        # Skip for now as it requires complex module resolution
+
+        return ValidationResult(
+            passed=len(violations) == 0,
+            violations=violations,
+        )
+
+    def _check_phase(self, phase: Dict) -> List[Violation]:
+        """Run all consistency checks for a single phase entry."""
+        violations: List[Violation] = []
+
+        phase_id = phase.get('id')
+        phase_name = phase.get('name', 'Unknown')
+        status = phase.get('status')
+        if isinstance(status, str):
+            # Intern the YAML-sourced status so it shares identity with the
+            # canonical literals and `is` comparisons are valid below.
+            status = sys.intern(status)
+        phase_path_str = phase.get('path')
+        installable = phase.get('installable', False)
+        runnable = phase.get('runnable', False)
+
+        if not phase_path_str:
+            violations.append(Violation(
+                checker='phase_consistency',
+                severity=ViolationSeverity.CRITICAL,
+                message=f"Phase {phase_id} ({phase_name}) missing path",
+                phase_id=phase_id,
+                phase_name=phase_name,
+            ))
+            return violations
+
+        phase_path = Path(phase_path_str)
+
+        # Fail-fast: once a phase has a CRITICAL violation there is no
+        # point running the README cross-check for it (skips the extra
+        # stat + read on already-broken phases).
+        phase_failed = False
+
+        # Check 1: IMPLEMENTED → module exists on disk
+        if status is _IMPLEMENTED:
+            if not phase_path.exists():
                 violations.append(Violation(
                     checker='phase_consistency',
                     severity=ViolationSeverity.CRITICAL,
-                    message=f"Phase {phase_id} ({phase_name}) missing path",
+                    message=f"Phase {phase_id} ({phase_name}) marked IMPLEMENTED but path does not exist: {phase_path}",
+                    details={'expected_path': str(phase_path)},
                     phase_id=phase_id,
                     phase_name=phase_name,
                 ))
-                continue
-            
-            phase_path = Path(phase_path_str)
-            
-            # Check 1: IMPLEMENTED → module exists on disk
-            if status == 'IMPLEMENTED':
-                if not phase_path.exists():
-                    violations.append(Violation(
-                        checker='phase_consistency',
-                        severity=ViolationSeverity.CRITICAL,
-                        message=f"Phase {phase_id} ({phase_name}) marked IMPLEMENTED but path does not exist: {phase_path}",
-                        details={'expected_path': str(phase_path)},
-                        phase_id=phase_id,
-                        phase_name=phase_name,
-                    ))
-                elif not phase_path.is_dir():
-                    violations.append(Violation(
-                        checker='phase_consistency',
-                        severity=ViolationSeverity.CRITICAL,
-                        message=f"Phase {phase_id} ({phase_name}) path exists but is not a directory: {phase_path}",
-                        details={'path': str(phase_path)},
-                        phase_id=phase_id,
-                        phase_name=phase_name,
-                    ))
-            
-            # Check 2: NOT_IMPLEMENTED → no service, no installer ref
-            elif status == 'NOT_IMPLEMENTED':
-                # Check if service exists (should not)
-                if installable or runnable:
-                    violations.append(Violation(
-                        checker='phase_consistency',
-                        severity=ViolationSeverity.CRITICAL,
-                        message=f"Phase {phase_id} ({phase_name}) marked NOT_IMPLEMENTED but installable={installable}, runnable={runnable}",
-                        details={
-                            'installable': installable,
-                            'runnable': runnable,
-                        },
-                        phase_id=phase_id,
-                        phase_name=phase_name,
-                    ))
-                
-                # Check if systemd unit exists for this phase (should not)
-                if phase_path.exists() and phase_path.is_dir():
-                    # Try to find corresponding systemd unit
-                    # This is heuristic - we check if any systemd unit matches phase naming
-                    phase_name_clean = phase_name.lower().replace(' ', '-').replace('(', '').replace(')', '')
-                    for unit_name in self.validator.systemd_units:
-                        if phase_name_clean in unit_name.lower() or f"phase-{phase_id}" in unit_name.lower():
-                            violations.append(Violation(
-                                checker='phase_consistency',
-                                severity=ViolationSeverity.WARNING,
-                                message=f"Phase {phase_id} ({phase_name}) marked NOT_IMPLEMENTED but systemd unit exists: {unit_name}",
-                                details={'unit_name': unit_name},
-                                phase_id=phase_id,
-                                phase_name=phase_name,
-                            ))
-            
-            # Check 3: README verdict matches guardrails status
-            if phase_id in self.validator.phase_readmes:
-                readme_path = self.validator.phase_readmes[phase_id]
-                try:
-                    readme_status = self._extract_readme_status(readme_path)
-                    if readme_status and readme_status.upper() != status:
+                phase_failed = True
+            elif not phase_path.is_dir():
+                violations.append(Violation(
+                    checker='phase_consistency',
+                    severity=ViolationSeverity.CRITICAL,
+                    message=f"Phase {phase_id} ({phase_name}) path exists but is not a directory: {phase_path}",
+                    details={'path': str(phase_path)},
+                    phase_id=phase_id,
+                    phase_name=phase_name,
+                ))
+                phase_failed = True
+
+        # Check 2: NOT_IMPLEMENTED → no service, no installer ref
+        elif status is _NOT_IMPLEMENTED:
+            # Check if service exists (should not)
+            if installable or runnable:
+                violations.append(Violation(
+                    checker='phase_consistency',
+                    severity=ViolationSeverity.CRITICAL,
+                    message=f"Phase {phase_id} ({phase_name}) marked NOT_IMPLEMENTED but installable={installable}, runnable={runnable}",
+                    details={
+                        'installable': installable,
+                        'runnable': runnable,
+                    },
+                    phase_id=phase_id,
+                    phase_name=phase_name,
+                ))
+                phase_failed = True
+
+            # Check if systemd unit exists for this phase (should not)
+            if phase_path.exists() and phase_path.is_dir():
+                # Try to find corresponding systemd unit
+                # This is heuristic - we check if any systemd unit matches phase naming
+                phase_name_clean = phase_name.lower().replace(' ', '-').replace('(', '').replace(')', '')
+                for unit_name in self._systemd_units:
+                    if phase_name_clean in unit_name.lower() or f"phase-{phase_id}" in unit_name.lower():
                         violations.append(Violation(
                             checker='phase_consistency',
-                            severity=ViolationSeverity.CRITICAL,
-                            message=f"Phase {phase_id} ({phase_name}) README status '{readme_status}' does not match guardrails status '{status}'",
-                            details={
-                                'readme_status': readme_status,
-                                'guardrails_status': status,
-                                'readme_path': str(readme_path),
-                            },
+                            severity=ViolationSeverity.WARNING,
+                            message=f"Phase {phase_id} ({phase_name}) marked NOT_IMPLEMENTED but systemd unit exists: {unit_name}",
+                            details={'unit_name': unit_name},
                             phase_id=phase_id,
                             phase_name=phase_name,
                         ))
-                except Exception as e:
+
+        # Check 3: README verdict matches guardrails status
+        # Skipped when the phase already failed a CRITICAL check above.
+        if phase_failed:
+            return violations
+
+        readme_path = self._phase_readmes.get(phase_id)
+        if readme_path is not None:
+            try:
+                readme_status = self._extract_readme_status(readme_path)
+                if readme_status and sys.intern(readme_status.upper()) is not status:
                     violations.append(Violation(
                         checker='phase_consistency',
-                        severity=ViolationSeverity.WARNING,
-                        message=f"Phase {phase_id} ({phase_name}) failed to parse README status: {e}",
-                        details={'readme_path': str(readme_path), 'error': str(e)},
+                        severity=ViolationSeverity.CRITICAL,
+                        message=f"Phase {phase_id} ({phase_name}) README status '{readme_status}' does not match guardrails status '{status}'",
+                        details={
+                            'readme_status': readme_status,
+                            'guardrails_status': status,
+                            'readme_path': str(readme_path),
+                        },
                         phase_id=phase_id,
                         phase_name=phase_name,
                     ))
-        
-        # Check for phases that exist on disk but not in guardrails (orphaned)
-        # This is harder - we'd need to scan all directories and match
-        # Skip for now as it requires complex module resolution
-        
-        return ValidationResult(
-            passed=len(violations) == 0,
-            violations=violations,
-        )
+            except Exception as e:
+                violations.append(Violation(
+                    checker='phase_consistency',
+                    severity=ViolationSeverity.WARNING,
+                    message=f"Phase {phase_id} ({phase_name}) failed to parse README status: {e}",
+                    details={'readme_path': str(readme_path), 'error': str(e)},
+                    phase_id=phase_id,
+                    phase_name=phase_name,
+                ))
+
+        return violations
     
     def _extract_readme_status(self, readme_path: Path) -> Optional[str]:
         """Extract status from README file."""
+        # Status markers as UTF-8 byte literals (✅ / ❌) - working on bytes
+        # avoids decoding the whole README just to probe a few substrings.
+        _CHECK = b'\xe2\x9c\x85'
+        _CROSS = b'\xe2\x9d\x8c'
+
         try:
-            with open(readme_path, 'r') as f:
-                content = f.read()
-            
-            # Look for status indicators
-            content_lower = content.lower()
-            
+            # The status verdict always appears near the top of a README;
+            # 8 KiB is more than enough and bounds the read cost.
+            with open(readme_path, 'rb') as f:
+                content = f.read(8192)
+
+            # Prefilter: a README without any status marker can never match,
+            # so bail out before allocating a lowered copy of the content.
+            if (_CHECK not in content and _CROSS not in content
+                    and b'status' not in content and b'STATUS' not in content
+                    and b'Status' not in content):
+                return None
+
+            # Lowercase lazily and exactly once - bytes.lower() is pure C and
+            # never decodes; most READMEs resolve on the marker paths first.
+            content_lower = None
+
+            def _lower() -> bytes:
+                nonlocal content_lower
+                if content_lower is None:
+                    content_lower = content.lower()
+                return content_lower
+
             # Check for explicit STATUS markers (most reliable)
-            if '## STATUS:' in content or '## STATUS :' in content:
-                if '✅' in content and 'implemented' in content_lower:
+            if b'## STATUS:' in content or b'## STATUS :' in content:
+                if _CHECK in content and b'implemented' in _lower():
                     return 'IMPLEMENTED'
-                if '❌' in content and 'not_implemented' in content_lower:
+                if _CROSS in content and b'not_implemented' in _lower():
                     return 'NOT_IMPLEMENTED'
-                if '❌' in content and 'not implemented' in content_lower:
+                if _CROSS in content and b'not implemented' in _lower():
                     return 'NOT_IMPLEMENTED'
-            
+
             # Check for status: line (case-insensitive)
             import re
-            status_match = re.search(r'status:\s*([✅❌]?\s*)?(implemented|not_implemented|not implemented)', content_lower, re.IGNORECASE)
+            status_match = re.search(
+                rb'status:\s*(?:(?:\xe2\x9c\x85|\xe2\x9d\x8c)?\s*)?(implemented|not_implemented|not implemented)',
+                _lower(),
+            )
             if status_match:
-                status_text = status_match.group(2)
-                if 'not' in status_text:
+                status_text = status_match.group(1)
+                if b'not' in status_text:
                     return 'NOT_IMPLEMENTED'
-                if 'implemented' in status_text:
+                if b'implemented' in status_text:
                     return 'IMPLEMENTED'
-            
+
             # Check for COMPLETE status
-            if 'status:' in content and 'complete' in content_lower:
+            if b'status:' in content and b'complete' in _lower():
                 return 'IMPLEMENTED'
-            if 'status:' in content and 'not implemented' in content_lower:
+            if b'status:' in content and b'not implemented' in _lower():
                 return 'NOT_IMPLEMENTED'
-            if 'status:' in content and 'not yet' in content_lower:
+            if b'status:' in content and b'not yet' in _lower():
                 return 'NOT_IMPLEMENTED'
-            
+
             # Check for explicit status markers
-            if '✅' in content and ('implemented' in content_lower or 'complete' in content_lower):
+            if _CHECK in content and (b'implemented' in _lower() or b'complete' in _lower()):
                 return 'IMPLEMENTED'
-            if '❌' in content and 'not_implemented' in content_lower:
+            if _CROSS in content and b'not_implemented' in _lower():
                 return 'NOT_IMPLEMENTED'
-            if '❌' in content and 'not implemented' in content_lower:
+            if _CROSS in content and b'not implemented' in _lower():
                 return 'NOT_IMPLEMENTED'
-            
+
             # Default: if README exists and has content, assume implemented
             # This is heuristic
             return None
@@ -0,0 +1,46 @@
+# Path and File Name : /home/ransomeye/rebuild/core/global_validator/tests/_util.py
+# Author: nXxBku0CKFAJCBN3X1g3bQk7OxYQylg8CMw1iGsq7gU
+# Details of functionality of this file: Shared fixture helpers for global validator tests
+
+"""
+Shared helpers for the global validator test modules.
+
+These were previously pasted into each test module; they live here so
+the three copies cannot drift.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Optional
+
+try:
+    import orjson  # Optional: C-accelerated JSON encoding
+    _dumps = orjson.dumps
+except ImportError:
+    def _dumps(obj):
+        return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+
+def _fast_rmtree(path: Path) -> None:
+    """Bottom-up unlink/rmdir walk; cheaper than shutil.rmtree for the
+    small fixture trees the tests create."""
+    for root, dirs, files in os.walk(path, topdown=False):
+        for f in files:
+            os.unlink(os.path.join(root, f))
+        for d in dirs:
+            os.rmdir(os.path.join(root, d))
+    os.rmdir(path)
+
+
+def _mkfile(path: Path, data: Optional[bytes]) -> None:
+    """Create parent dirs and write raw bytes, bypassing the text-io layer.
+
+    data=None only touches the file, for callers that existence-check
+    artifacts without reading them.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if data is None:
+        path.touch()
+    else:
+        path.write_bytes(data)
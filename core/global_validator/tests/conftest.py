@@ -0,0 +1,37 @@
+# Path and File Name : /home/ransomeye/rebuild/core/global_validator/tests/conftest.py
+# Author: nXxBku0CKFAJCBN3X1g3bQk7OxYQylg8CMw1iGsq7gU
+# Details of functionality of this file: Shared pytest configuration for global validator tests
+
+"""
+Pytest configuration for the global validator test suite.
+
+Keeps the suite safe under parallel execution (pytest-xdist -n auto):
+each TestCase class is pinned to a single worker so class-scoped
+fixtures (shared scratch dirs, cached validators) stay hot instead of
+being rebuilt on every worker.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Make `core.global_validator` importable regardless of the invocation
+# directory; previously each test module repeated this insert.
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+# Import the validator package (and its yaml/json transitive deps) once
+# here; test modules then hit the sys.modules cache instead of paying
+# the import three times during collection.
+import yaml  # noqa: F401
+from core.global_validator import validator as _validator  # noqa: F401
+
+
+def pytest_collection_modifyitems(config, items):
+    """Group each TestCase class onto one xdist worker."""
+    if not config.pluginmanager.hasplugin('xdist'):
+        return
+    for item in items:
+        cls = getattr(item, 'cls', None)
+        if cls is not None:
+            item.add_marker(pytest.mark.xdist_group(cls.__name__))
@@ -12,145 +12,95 @@ These tests verify that:
 4. Registered model with all artifacts → PASS
 """
 
+import sys
 import unittest
+import atexit
+import itertools
+import os
 import tempfile
 import shutil
-import json
+import yaml
 from pathlib import Path
-import sys
 
-# Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+# sys.path setup lives in conftest.py for pytest runs; direct script
+# invocation (python3 .../test_*.py) puts tests/ -- not the repo root --
+# on sys.path, so the __main__ path adds the root itself (same guard as
+# validate.py).
+if __package__ in (None, ''):
+    sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
 
 from core.global_validator.ai_ml_claims import AIMLClaimValidator
-from core.global_validator.validator import GlobalForensicValidator, ViolationSeverity
+from core.global_validator.validator import GlobalForensicValidator
+from core.global_validator.tests._util import _dumps, _fast_rmtree, _mkfile
 
 
 class TestRegistryBoundary(unittest.TestCase):
     """Test registry boundary enforcement."""
-    
-    def setUp(self):
-        """Set up test environment."""
-        self.test_dir = Path(tempfile.mkdtemp(prefix="registry_test_"))
-        self.test_project_root = self.test_dir / "rebuild"
-        self.test_project_root.mkdir(parents=True)
-        
-        # Create registry structure
-        self.registry_dir = self.test_project_root / "ransomeye_intelligence" / "model_registry"
-        self.registry_dir.mkdir(parents=True)
-        self.registry_file = self.registry_dir / "registry.json"
-        
-        # Create guardrails structure
-        self.guardrails_dir = self.test_project_root / "core" / "guardrails"
-        self.guardrails_dir.mkdir(parents=True)
-        self.guardrails_file = self.guardrails_dir / "guardrails.yaml"
-        
-        # Create minimal guardrails
+
+    _seq = itertools.count()
+
+    # Class-level validator/checker pair, built on first use and reset
+    # (re-pointed + state cleared) per test instead of reconstructed.
+    _validator = None
+    _ai_ml_checker = None
+
+    @classmethod
+    def setUpClass(cls):
+        """Create one shared scratch base, tmpfs-backed when available.
+
+        Per-test dirs are cheap subdirs of this base instead of fresh
+        mkdtemp trees on (possibly disk-backed) default tempdir.
+        """
+        base_root = os.environ.get(
+            'RANSOMEYE_TEST_TMP',
+            '/dev/shm' if os.path.isdir('/dev/shm') else tempfile.gettempdir()
+        )
+        # Scope the scratch dir to the xdist worker (or pid when running
+        # serially), then mkdtemp the class dir inside it: the worker id
+        # is stable across sessions (gw0, gw1, ...), so a deterministic
+        # leaf would be shared by concurrent runs and inherited — stale
+        # t0/t1 trees and all — after a killed run. mkdtemp keeps the
+        # uniqueness guarantee while staying on the tmpfs-backed base.
+        worker = os.environ.get('PYTEST_XDIST_WORKER', str(os.getpid()))
+        worker_root = Path(base_root) / "ransomeye-tests" / worker
+        worker_root.mkdir(parents=True, exist_ok=True)
+        cls.base = Path(tempfile.mkdtemp(prefix="registry-", dir=worker_root))
+
+        # Fast-teardown graveyard: with RANSOMEYE_FAST_TEARDOWN set,
+        # per-test dirs are renamed here (one syscall) and the whole
+        # pile is reaped once at interpreter exit.
+        cls._graveyard = cls.base / "_graveyard"
+        cls._graveyard.mkdir(exist_ok=True)
+        atexit.register(shutil.rmtree, cls._graveyard, ignore_errors=True)
+
+        # Render the guardrails fixture ONCE; per-test setUp just patches
+        # in the project root and writes the bytes (no per-test YAML dump).
         guardrails = {
             'allowed_phases': [
                 {
                     'id': 3,
                     'name': 'Alert Engine & Policy Manager',
-                    'path': str(self.test_project_root / "ransomeye_intelligence"),
+                    'path': '__ROOT__/ransomeye_intelligence',
                     'status': 'IMPLEMENTED',
                     'installable': True,
                     'runnable': True,
                 }
             ]
         }
-        
-        import yaml
-        with open(self.guardrails_file, 'w') as f:
-            yaml.dump(guardrails, f)
-    
-    def tearDown(self):
-        """Clean up test environment."""
-        shutil.rmtree(self.test_dir, ignore_errors=True)
-    
-    def test_pkl_outside_registry_ignored(self):
-        """Test: .pkl file outside registry → ignored (no violation)."""
-        # Create a .pkl file outside registry
-        random_pkl = self.test_project_root / "ransomeye_intelligence" / "some_random_model.pkl"
-        random_pkl.parent.mkdir(parents=True, exist_ok=True)
-        random_pkl.write_bytes(b"fake model data")
-        
-        # Create empty registry (no models registered)
-        registry = {
+        cls._GUARDRAILS_TEMPLATE = yaml.safe_dump(
+            guardrails, sort_keys=False).encode('utf-8')
+
+        # Pre-encode the two registry bodies used by the tests; per-test
+        # writes substitute the registry root instead of re-running the
+        # JSON encoder for every test.
+        cls._REG_EMPTY = _dumps({
             'version': '1.0.0',
-            'registry_root': str(self.registry_dir) + '/',
+            'registry_root': '__ROOT__',
             'models': []
-        }
-        with open(self.registry_file, 'w') as f:
-            json.dump(registry, f)
-        
-        # Create validator
-        validator = GlobalForensicValidator(project_root=self.test_project_root)
-        ai_ml_checker = AIMLClaimValidator(validator)
-        
-        # Run validation - should pass (unregistered model ignored)
-        result = ai_ml_checker.validate()
-        
-        # Should pass - no violations for unregistered models
-        self.assertTrue(result.passed, "Unregistered models should be ignored")
-        self.assertEqual(len(result.violations), 0, "Should have no violations for unregistered models")
-    
-    def test_registered_model_without_shap_fails(self):
-        """Test: Registered model without SHAP → FAIL."""
-        # Create a model file
-        model_file = self.registry_dir / "test_model.pkl"
-        model_file.write_bytes(b"fake model data")
-        
-        # Register model in registry (without SHAP file)
-        registry = {
-            'version': '1.0.0',
-            'registry_root': str(self.registry_dir) + '/',
-            'models': [
-                {
-                    'model_id': 'test-model-1',
-                    'phase': 3,
-                    'path': 'test_model.pkl',
-                    'hash': 'sha256-hash',
-                    'trained_on': 'test-dataset',
-                    'version': '1.0.0',
-                    'requires_shap': True,
-                    'signature': 'ed25519-signature'
-                }
-            ]
-        }
-        with open(self.registry_file, 'w') as f:
-            json.dump(registry, f)
-        
-        # Create validator
-        validator = GlobalForensicValidator(project_root=self.test_project_root)
-        ai_ml_checker = AIMLClaimValidator(validator)
-        
-        # Run validation - should fail
-        result = ai_ml_checker.validate()
-        
-        # Should fail - missing SHAP
-        self.assertFalse(result.passed, "Registered model without SHAP should fail")
-        self.assertGreater(len(result.violations), 0, "Should have violations")
-        
-        violation_messages = [v.message for v in result.violations]
-        self.assertTrue(
-            any('SHAP' in msg for msg in violation_messages),
-            "Should detect missing SHAP file"
-        )
-    
-    def test_registered_model_without_metadata_fails(self):
-        """Test: Registered model without metadata → FAIL."""
-        # Create a model file
-        model_file = self.registry_dir / "test_model.pkl"
-        model_file.write_bytes(b"fake model data")
-        
-        # Create SHAP file
-        shap_file = self.registry_dir / "test_model_shap.json"
-        shap_file.write_text('{"shap": "values"}')
-        
-        # Register model in registry (without metadata file)
-        registry = {
+        })
+        cls._REG_MODEL = _dumps({
             'version': '1.0.0',
-            'registry_root': str(self.registry_dir) + '/',
+            'registry_root': '__ROOT__',
             'models': [
                 {
                     'model_id': 'test-model-1',
@@ -163,97 +113,160 @@ class TestRegistryBoundary(unittest.TestCase):
                     'signature': 'ed25519-signature'
                 }
             ]
-        }
-        with open(self.registry_file, 'w') as f:
-            json.dump(registry, f)
-        
-        # Create validator
-        validator = GlobalForensicValidator(project_root=self.test_project_root)
-        ai_ml_checker = AIMLClaimValidator(validator)
-        
-        # Run validation - should fail
-        result = ai_ml_checker.validate()
-        
-        # Should fail - missing metadata
-        self.assertFalse(result.passed, "Registered model without metadata should fail")
-        self.assertGreater(len(result.violations), 0, "Should have violations")
-        
-        violation_messages = [v.message for v in result.violations]
-        self.assertTrue(
-            any('metadata' in msg.lower() for msg in violation_messages),
-            "Should detect missing metadata file"
-        )
+        })
+
+    @classmethod
+    def tearDownClass(cls):
+        """Remove the shared scratch base once, after all tests."""
+        cls._validator = None
+        cls._ai_ml_checker = None
+        shutil.rmtree(cls.base, ignore_errors=True)
+
+    def _get_ai_ml_checker(self):
+        """Return the shared AI/ML checker, reset for this test's root.
+
+        Constructing GlobalForensicValidator per test is redundant work;
+        the checker only reads path attributes and per-run state, so the
+        shared pair is re-pointed and its mutable state cleared instead.
+        AIMLClaimValidator reloads the registry on every validate() call,
+        so clearing registry/registered_models here is sufficient — no
+        further invalidation hook is needed.
+        """
+        cls = type(self)
+        if cls._validator is None:
+            cls._validator = GlobalForensicValidator(
+                project_root=self.test_project_root)
+            cls._ai_ml_checker = AIMLClaimValidator(cls._validator)
+        else:
+            v = cls._validator
+            v.project_root = self.test_project_root
+            v.guardrails_path = self.test_project_root / "core/guardrails/guardrails.yaml"
+            v.systemd_dir = self.test_project_root / "systemd"
+            v.readme_dir = self.test_project_root / "docs/readme"
+            v.violations.clear()
+            v.guardrails = None
+            v.install_manifest = None
+            v.systemd_units = []
+            v.phase_readmes = {}
+            cls._ai_ml_checker.registry = None
+            cls._ai_ml_checker.registered_models = []
+        return cls._ai_ml_checker
+
+    def setUp(self):
+        """Set up test environment."""
+        self.test_dir = self.base / f"t{next(self._seq)}"
+        self.test_project_root = self.test_dir / "rebuild"
+
+        # Registry and guardrails structure
+        self.registry_dir = self.test_project_root / "ransomeye_intelligence" / "model_registry"
+        self.registry_file = self.registry_dir / "registry.json"
+        self.guardrails_dir = self.test_project_root / "core" / "guardrails"
+        self.guardrails_file = self.guardrails_dir / "guardrails.yaml"
+
+        # One makedirs per leaf creates every intermediate directory.
+        for leaf in (self.registry_dir, self.guardrails_dir):
+            os.makedirs(leaf, exist_ok=True)
+
+        # Write the pre-rendered guardrails template with this test's root
+        self.guardrails_file.write_bytes(
+            self._GUARDRAILS_TEMPLATE.replace(
+                b'__ROOT__', str(self.test_project_root).encode('utf-8')))
     
-    def test_registered_model_with_all_artifacts_passes(self):
-        """Test: Registered model with all artifacts → PASS."""
-        # Create a model file
-        model_file = self.registry_dir / "test_model.pkl"
-        model_file.write_bytes(b"fake model data")
-        
-        # Create SHAP file
-        shap_file = self.registry_dir / "test_model_shap.json"
-        shap_file.write_text('{"shap": "values"}')
-        
-        # Create metadata file with required fields
-        metadata_file = self.registry_dir / "test_model_metadata.json"
-        metadata = {
-            'hash': 'sha256-hash',
-            'trained_on': 'test-dataset',
-            'version': '1.0.0'
-        }
-        metadata_file.write_text(json.dumps(metadata))
-        
-        # Register model in registry
-        registry = {
-            'version': '1.0.0',
-            'registry_root': str(self.registry_dir) + '/',
-            'models': [
-                {
-                    'model_id': 'test-model-1',
-                    'phase': 3,
-                    'path': 'test_model.pkl',
-                    'hash': 'sha256-hash',
-                    'trained_on': 'test-dataset',
-                    'version': '1.0.0',
-                    'requires_shap': True,
-                    'signature': 'ed25519-signature'
-                }
-            ]
-        }
-        with open(self.registry_file, 'w') as f:
-            json.dump(registry, f)
-        
-        # Create validator
-        validator = GlobalForensicValidator(project_root=self.test_project_root)
-        ai_ml_checker = AIMLClaimValidator(validator)
-        
-        # Run validation - should pass
-        result = ai_ml_checker.validate()
-        
-        # Should pass - all artifacts present
-        self.assertTrue(result.passed, "Registered model with all artifacts should pass")
-        self.assertEqual(len(result.violations), 0, "Should have no violations")
+    def tearDown(self):
+        """Clean up test environment."""
+        if os.environ.get('RANSOMEYE_FAST_TEARDOWN'):
+            # Defer the recursive delete: one rename now, one reap at exit.
+            os.rename(self.test_dir, self._graveyard / self.test_dir.name)
+        else:
+            try:
+                _fast_rmtree(self.test_dir)
+            except OSError:
+                shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def _write_registry(self, template: bytes) -> None:
+        """Write a pre-encoded registry body with this test's registry root."""
+        self.registry_file.write_bytes(template.replace(
+            b'__ROOT__', str(self.registry_dir).encode('utf-8') + b'/'))
     
+    # Registry matrix cases: (name, files relative to project root,
+    # registry template attribute, expected pass, expected message substring).
+    _METADATA = _dumps({
+        'hash': 'sha256-hash',
+        'trained_on': 'test-dataset',
+        'version': '1.0.0'
+    })
+
+    REGISTRY_CASES = [
+        # .pkl file outside registry -> ignored (no violation)
+        ('pkl_outside_registry_ignored',
+         {'ransomeye_intelligence/some_random_model.pkl': None},
+         '_REG_EMPTY', True, None),
+        # Registered model without SHAP -> FAIL
+        ('registered_model_without_shap_fails',
+         {'ransomeye_intelligence/model_registry/test_model.pkl': None},
+         '_REG_MODEL', False, 'SHAP'),
+        # Registered model without metadata -> FAIL
+        ('registered_model_without_metadata_fails',
+         {'ransomeye_intelligence/model_registry/test_model.pkl': None,
+          'ransomeye_intelligence/model_registry/test_model_shap.json': b'{"shap": "values"}'},
+         '_REG_MODEL', False, 'metadata'),
+        # Registered model with all artifacts -> PASS
+        ('registered_model_with_all_artifacts_passes',
+         {'ransomeye_intelligence/model_registry/test_model.pkl': None,
+          'ransomeye_intelligence/model_registry/test_model_shap.json': b'{"shap": "values"}',
+          'ransomeye_intelligence/model_registry/test_model_metadata.json': _METADATA},
+         '_REG_MODEL', True, None),
+    ]
+
+    def _apply_spec(self, spec):
+        """Mutate the shared layout to match spec, touching only deltas."""
+        current = self._current_files
+        for rel in list(current):
+            if rel not in spec:
+                (self.test_project_root / rel).unlink(missing_ok=True)
+                del current[rel]
+        for rel, data in spec.items():
+            if current.get(rel) != data:
+                _mkfile(self.test_project_root / rel, data)
+                current[rel] = data
+
+    def test_registry_matrix(self):
+        """Run the four registry boundary cases over one mutating layout."""
+        self._current_files = {}
+        for name, spec, template, should_pass, substr in self.REGISTRY_CASES:
+            with self.subTest(name):
+                self._apply_spec(spec)
+                self._write_registry(getattr(self, template))
+
+                ai_ml_checker = self._get_ai_ml_checker()
+                result = ai_ml_checker.validate()
+
+                self.assertEqual(result.passed, should_pass,
+                                 f"{name}: expected passed={should_pass}")
+                if should_pass:
+                    self.assertEqual(len(result.violations), 0,
+                                     f"{name}: should have no violations")
+                else:
+                    self.assertGreater(len(result.violations), 0,
+                                       f"{name}: should have violations")
+                    self.assertTrue(
+                        any(substr.lower() in v.message.lower()
+                            for v in result.violations),
+                        f"{name}: should mention '{substr}'"
+                    )
+
     def test_excluded_paths_ignored(self):
         """Test: Files in excluded paths (.venv, site-packages) → ignored."""
         # Create .pkl file in .venv (should be ignored)
-        venv_dir = self.test_project_root / "ransomeye_intelligence" / ".venv" / "lib" / "site-packages"
-        venv_dir.mkdir(parents=True, exist_ok=True)
-        venv_pkl = venv_dir / "dependency_model.pkl"
-        venv_pkl.write_bytes(b"dependency data")
+        venv_pkl = (self.test_project_root / "ransomeye_intelligence" / ".venv"
+                    / "lib" / "site-packages" / "dependency_model.pkl")
+        _mkfile(venv_pkl, None)
         
         # Create empty registry
-        registry = {
-            'version': '1.0.0',
-            'registry_root': str(self.registry_dir) + '/',
-            'models': []
-        }
-        with open(self.registry_file, 'w') as f:
-            json.dump(registry, f)
+        self._write_registry(self._REG_EMPTY)
         
-        # Create validator
-        validator = GlobalForensicValidator(project_root=self.test_project_root)
-        ai_ml_checker = AIMLClaimValidator(validator)
+        # Reuse the class-level validator/checker pair
+        ai_ml_checker = self._get_ai_ml_checker()
         
         # Run validation - should pass (excluded paths ignored)
         result = ai_ml_checker.validate()
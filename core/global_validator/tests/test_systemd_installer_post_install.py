@@ -12,48 +12,53 @@ Tests:
 4. Pre-install mode validates source templates correctly
 """
 
+import sys
 import unittest
+import os
 import tempfile
 import shutil
-import json
 import yaml
 from pathlib import Path
-import sys
 
-# Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+# sys.path setup lives in conftest.py for pytest runs; direct script
+# invocation (python3 .../test_*.py) puts tests/ -- not the repo root --
+# on sys.path, so the __main__ path adds the root itself (same guard as
+# validate.py).
+if __package__ in (None, ''):
+    sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
 
-from core.global_validator.validator import GlobalForensicValidator, ViolationSeverity
+from core.global_validator.validator import GlobalForensicValidator
 from core.global_validator.systemd_installer import SystemdInstallerValidator
+from core.global_validator.tests._util import _dumps, _fast_rmtree
+
+
+# Shared source-unit fixture (deliberately references /home paths).
+_UNIT_BYTES = b"""[Unit]
+Description=Test Service
+ConditionPathExists=/home/ransomeye/rebuild
+
+[Service]
+WorkingDirectory=/home/ransomeye/rebuild
+ExecStart=/home/ransomeye/rebuild/bin/test
+"""
 
 
 class TestSystemdInstallerPostInstall(unittest.TestCase):
     """Test systemd installer validator post-install mode."""
-    
-    def setUp(self):
-        """Set up test environment."""
-        self.test_dir = Path(tempfile.mkdtemp(prefix="systemd_installer_test_"))
-        self.test_project_root = self.test_dir / "rebuild"
-        self.test_project_root.mkdir(parents=True)
-        
-        # Create minimal guardrails structure
-        self.guardrails_dir = self.test_project_root / "core" / "guardrails"
-        self.guardrails_dir.mkdir(parents=True)
-        
-        # Create systemd directory (source templates)
-        self.systemd_dir = self.test_project_root / "systemd"
-        self.systemd_dir.mkdir(parents=True)
-        
-        # Create installed systemd directory (simulated /etc/systemd/system)
-        self.installed_systemd_dir = self.test_dir / "etc" / "systemd" / "system"
-        self.installed_systemd_dir.mkdir(parents=True)
-        
-        # Create install manifest directory
-        self.install_manifest_dir = self.test_dir / "var" / "lib" / "ransomeye"
-        self.install_manifest_dir.mkdir(parents=True)
-        
-        # Create minimal guardrails
-        guardrails = {
+
+    @classmethod
+    def setUpClass(cls):
+        """Build the class-scoped fixtures once (pytest module-fixture style).
+
+        The guardrails body, install manifest body and the unit template
+        are identical for every test, so they are rendered a single time
+        here; per-test setUp only materializes files into a fresh dir.
+        """
+        cls._template_dir = Path(tempfile.mkdtemp(prefix="systemd_installer_tpl_"))
+        cls._unit_template = cls._template_dir / "_unit.tpl"
+        cls._unit_template.write_bytes(_UNIT_BYTES)
+
+        cls._GUARDRAILS_BYTES = yaml.safe_dump({
             'allowed_phases': [
                 {
                     'id': 1,
@@ -62,57 +67,94 @@ class TestSystemdInstallerPostInstall(unittest.TestCase):
                     'path': 'test_module',
                 }
             ]
-        }
-        
-        guardrails_file = self.guardrails_dir / "guardrails.yaml"
-        with open(guardrails_file, 'w') as f:
-            yaml.dump(guardrails, f)
-    
-    def tearDown(self):
-        """Clean up test environment."""
-        shutil.rmtree(self.test_dir, ignore_errors=True)
-    
-    def test_post_install_mode_detection(self):
-        """Test that post-install mode is correctly detected when install_manifest exists."""
-        # Create source template with /home path (should be ignored in post-install)
-        source_unit = self.systemd_dir / "ransomeye-test.service"
-        source_unit.write_text("""[Unit]
-Description=Test Service
-ConditionPathExists=/home/ransomeye/rebuild
+        }, sort_keys=False).encode('utf-8')
 
-[Service]
-WorkingDirectory=/home/ransomeye/rebuild
-ExecStart=/home/ransomeye/rebuild/bin/test
-""")
-        
-        # Create install manifest (triggers post-install mode)
-        install_manifest = {
+        cls._MANIFEST_BYTES = _dumps({
             'modules': {
                 'test_module': {
                     'phase': 1,
                 }
             }
-        }
-        install_manifest_file = self.install_manifest_dir / "install_manifest.json"
-        with open(install_manifest_file, 'w') as f:
-            json.dump(install_manifest, f)
-        
-        # Create validator
-        validator = GlobalForensicValidator(project_root=self.test_project_root)
-        validator.install_manifest_path = install_manifest_file
-        validator.systemd_dir = self.systemd_dir
+        })
+
+    @classmethod
+    def tearDownClass(cls):
+        """Remove the shared template directory."""
+        cls._shared_post_install = None
+        shutil.rmtree(cls._template_dir, ignore_errors=True)
+
+    _shared_post_install = None
+
+    def _post_install_run(self):
+        """Build the standard post-install scenario once and reuse it.
+
+        Both post-install tests use byte-identical fixtures, so the
+        first caller materializes the tree, runs load_artifacts and
+        validate(), and the (validator, checker, result) triple is
+        cached for the second test to assert on.
+        """
+        cls = type(self)
+        if cls._shared_post_install is None:
+            # Source template with /home path (ignored in post-install)
+            self._link_unit(self.systemd_dir / "ransomeye-test.service")
+
+            # Install manifest (triggers post-install mode)
+            install_manifest_file = self.install_manifest_dir / "install_manifest.json"
+            install_manifest_file.write_bytes(self._MANIFEST_BYTES)
+
+            validator = GlobalForensicValidator(project_root=self.test_project_root)
+            validator.install_manifest_path = install_manifest_file
+            validator.systemd_dir = self.systemd_dir
+
+            validator.load_artifacts()
+
+            sysd_validator = SystemdInstallerValidator(validator)
+            cls._shared_post_install = (
+                validator, sysd_validator, sysd_validator.validate())
+        return cls._shared_post_install
+
+    def _link_unit(self, dest: Path) -> None:
+        """Materialize the unit fixture by inode reuse (no data copy)."""
+        try:
+            os.link(self._unit_template, dest)
+        except OSError:
+            # Cross-device or no-hardlink FS: fall back to a plain copy
+            shutil.copyfile(self._unit_template, dest)
+
+    def setUp(self):
+        """Set up test environment."""
+        self.test_dir = Path(tempfile.mkdtemp(prefix="systemd_installer_test_"))
+        self.test_project_root = self.test_dir / "rebuild"
+
+        # Guardrails structure, source templates, simulated
+        # /etc/systemd/system and install manifest directories
+        self.guardrails_dir = self.test_project_root / "core" / "guardrails"
+        self.systemd_dir = self.test_project_root / "systemd"
+        self.installed_systemd_dir = self.test_dir / "etc" / "systemd" / "system"
+        self.install_manifest_dir = self.test_dir / "var" / "lib" / "ransomeye"
+
+        # One makedirs per leaf creates every intermediate directory.
+        for leaf in (self.guardrails_dir, self.systemd_dir,
+                     self.installed_systemd_dir, self.install_manifest_dir):
+            os.makedirs(leaf, exist_ok=True)
         
-        validator.load_artifacts()
+        # Write the pre-rendered guardrails body
+        (self.guardrails_dir / "guardrails.yaml").write_bytes(self._GUARDRAILS_BYTES)
+    
+    def tearDown(self):
+        """Clean up test environment."""
+        try:
+            _fast_rmtree(self.test_dir)
+        except OSError:
+            shutil.rmtree(self.test_dir, ignore_errors=True)
+    
+    def test_post_install_mode_detection(self):
+        """Test that post-install mode is correctly detected when install_manifest exists."""
+        validator, _, result = self._post_install_run()
         
         # Verify install_manifest is loaded (triggers post-install mode)
         self.assertIsNotNone(validator.install_manifest, "Install manifest should be loaded")
         
-        # Create systemd installer validator
-        sysd_validator = SystemdInstallerValidator(validator)
-        
-        # Run validation
-        result = sysd_validator.validate()
-        
         # In post-install mode, source templates with /home should be IGNORED
         # (Only /etc/systemd/system/ units are checked, which may not exist in test)
         # So validation should pass if no installed units exist or if they're correct
@@ -123,41 +165,7 @@ ExecStart=/home/ransomeye/rebuild/bin/test
     
     def test_post_install_checks_installed_units_not_source(self):
         """Test that post-install mode checks installed units, not source templates."""
-        # Create source template with /home path (should be IGNORED in post-install)
-        source_unit = self.systemd_dir / "ransomeye-test.service"
-        source_unit.write_text("""[Unit]
-Description=Test Service
-ConditionPathExists=/home/ransomeye/rebuild
-
-[Service]
-WorkingDirectory=/home/ransomeye/rebuild
-ExecStart=/home/ransomeye/rebuild/bin/test
-""")
-        
-        # Create install manifest (triggers post-install mode)
-        install_manifest = {
-            'modules': {
-                'test_module': {
-                    'phase': 1,
-                }
-            }
-        }
-        install_manifest_file = self.install_manifest_dir / "install_manifest.json"
-        with open(install_manifest_file, 'w') as f:
-            json.dump(install_manifest, f)
-        
-        # Create validator
-        validator = GlobalForensicValidator(project_root=self.test_project_root)
-        validator.install_manifest_path = install_manifest_file
-        validator.systemd_dir = self.systemd_dir
-        
-        validator.load_artifacts()
-        
-        # Create systemd installer validator
-        sysd_validator = SystemdInstallerValidator(validator)
-        
-        # Run validation
-        result = sysd_validator.validate()
+        _, _, result = self._post_install_run()
         
         # Source template violations should NOT appear (they're ignored in post-install)
         source_violations = [v for v in result.violations if 'SOURCE TEMPLATE' in v.message]
@@ -169,14 +177,7 @@ ExecStart=/home/ransomeye/rebuild/bin/test
         """Test that pre-install mode validates source templates."""
         # Create source template with /home path (should FAIL in pre-install)
         source_unit = self.systemd_dir / "ransomeye-test.service"
-        source_unit.write_text("""[Unit]
-Description=Test Service
-ConditionPathExists=/home/ransomeye/rebuild
-
-[Service]
-WorkingDirectory=/home/ransomeye/rebuild
-ExecStart=/home/ransomeye/rebuild/bin/test
-""")
+        self._link_unit(source_unit)
         
         # NO install manifest (triggers pre-install mode)
         
@@ -9,18 +9,22 @@ These tests intentionally create violations to verify the validator detects them
 All tests must FAIL by design (testing fail-closed behavior).
 """
 
+import sys
 import unittest
 import tempfile
 import shutil
-import json
 import yaml
 from pathlib import Path
-import sys
 
-# Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+# sys.path setup lives in conftest.py for pytest runs; direct script
+# invocation (python3 .../test_*.py) puts tests/ -- not the repo root --
+# on sys.path, so the __main__ path adds the root itself (same guard as
+# validate.py).
+if __package__ in (None, ''):
+    sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
 
 from core.global_validator.validator import GlobalForensicValidator, ViolationSeverity
+from core.global_validator.tests._util import _fast_rmtree, _mkfile
 
 
 class TestValidatorWithViolations(unittest.TestCase):
@@ -46,7 +50,10 @@ class TestValidatorWithViolations(unittest.TestCase):
     
     def tearDown(self):
         """Clean up test environment."""
-        shutil.rmtree(self.test_dir, ignore_errors=True)
+        try:
+            _fast_rmtree(self.test_dir)
+        except OSError:
+            shutil.rmtree(self.test_dir, ignore_errors=True)
     
     def test_phase_implemented_but_path_missing(self):
         """Test: Phase marked IMPLEMENTED but path doesn't exist."""
@@ -65,8 +72,7 @@ class TestValidatorWithViolations(unittest.TestCase):
         }
         
         guardrails_file = self.guardrails_dir / "guardrails.yaml"
-        with open(guardrails_file, 'w') as f:
-            yaml.dump(guardrails, f)
+        _mkfile(guardrails_file, yaml.safe_dump(guardrails, sort_keys=False).encode('utf-8'))
         
         # Run validator
         validator = GlobalForensicValidator(project_root=self.test_project_root)
@@ -104,12 +110,11 @@ class TestValidatorWithViolations(unittest.TestCase):
         }
         
         guardrails_file = self.guardrails_dir / "guardrails.yaml"
-        with open(guardrails_file, 'w') as f:
-            yaml.dump(guardrails, f)
+        _mkfile(guardrails_file, yaml.safe_dump(guardrails, sort_keys=False).encode('utf-8'))
         
         # Create systemd service (should not exist)
         service_file = self.systemd_dir / "ransomeye-test-phase.service"
-        service_file.write_text("[Unit]\nDescription=Test Service\n")
+        service_file.write_bytes(b"[Unit]\nDescription=Test Service\n")
         
         # Run validator
         validator = GlobalForensicValidator(project_root=self.test_project_root)
@@ -124,12 +129,11 @@ class TestValidatorWithViolations(unittest.TestCase):
         # Create guardrails.yaml (minimal)
         guardrails = {'allowed_phases': []}
         guardrails_file = self.guardrails_dir / "guardrails.yaml"
-        with open(guardrails_file, 'w') as f:
-            yaml.dump(guardrails, f)
+        _mkfile(guardrails_file, yaml.safe_dump(guardrails, sort_keys=False).encode('utf-8'))
         
         # Create systemd service outside unified directory
         rogue_service = self.test_project_root / "rogue.service"
-        rogue_service.write_text("[Unit]\nDescription=Rogue Service\n")
+        rogue_service.write_bytes(b"[Unit]\nDescription=Rogue Service\n")
         
         # Run validator
         validator = GlobalForensicValidator(project_root=self.test_project_root)
@@ -161,8 +165,7 @@ class TestValidatorWithViolations(unittest.TestCase):
         
         guardrails = {'allowed_phases': []}
         guardrails_file = self.guardrails_dir / "guardrails.yaml"
-        with open(guardrails_file, 'w') as f:
-            yaml.dump(guardrails, f)
+        _mkfile(guardrails_file, yaml.safe_dump(guardrails, sort_keys=False).encode('utf-8'))
         
         # Run validator
         validator = GlobalForensicValidator(project_root=self.test_project_root)
@@ -178,11 +181,8 @@ class TestValidatorOutput(unittest.TestCase):
     
     def test_json_report_format(self):
         """Test that JSON report is valid."""
-        from core.global_validator.validator import GlobalForensicValidator, ValidationResult, Violation, ViolationSeverity
-        
-        # Create minimal validator
-        validator = GlobalForensicValidator(project_root=Path("/home/ransomeye/rebuild"))
-        
+        from core.global_validator.validator import build_report, ValidationResult, Violation, ViolationSeverity
+
         # Create test result
         test_violation = Violation(
             checker='test_checker',
@@ -199,8 +199,8 @@ class TestValidatorOutput(unittest.TestCase):
             summary={'total_violations': 1}
         )
         
-        # Generate report
-        report = validator.generate_report(result)
+        # Generate report without bootstrapping a full validator
+        report = build_report(result)
         
         # Verify JSON structure
         self.assertIn('validation_timestamp', report)
@@ -20,11 +20,24 @@ import json
 import argparse
 from pathlib import Path
 
-# Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+# Add parent directory to path - only for direct script invocation.
+# When imported as core.global_validator.validate the repo root is
+# already importable and the insert (which invalidates importlib's
+# path finder caches) is skipped.
+if __package__ in (None, ''):
+    sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from core.global_validator.validator import GlobalForensicValidator
 
+try:
+    import orjson  # Optional: C-accelerated JSON serialization
+
+    def _dumps(obj, pretty: bool) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0)
+except ImportError:
+    def _dumps(obj, pretty: bool) -> bytes:
+        return json.dumps(obj, indent=2 if pretty else None).encode('utf-8')
+
 
 def main():
     """Main CLI entry point."""
@@ -57,6 +70,12 @@ Examples:
         action='store_true',
         help='Output JSON format (default: always JSON)'
     )
+
+    parser.add_argument(
+        '--debug',
+        action='store_true',
+        help='Include a full traceback in error output'
+    )
     
     args = parser.parse_args()
     
@@ -70,19 +89,22 @@ Examples:
         # Generate report
         report = validator.generate_report(result)
         
-        # Output report
-        report_json = json.dumps(report, indent=2)
+        # Output report. Pretty-print for files and interactive runs;
+        # piped output skips the indent (and the extra allocation).
+        pretty = bool(args.output) or sys.stdout.isatty()
+        report_bytes = _dumps(report, pretty)
         
         if args.output:
             # Write to file
             output_path = Path(args.output)
             output_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(output_path, 'w') as f:
-                f.write(report_json)
+            with open(output_path, 'wb') as f:
+                f.write(report_bytes)
             print(f"Validation report written to: {output_path}", file=sys.stderr)
         else:
             # Print to stdout
-            print(report_json)
+            sys.stdout.buffer.write(report_bytes + b'\n')
+            sys.stdout.buffer.flush()
         
         # Exit with appropriate code
         if result.passed:
@@ -91,9 +113,17 @@ Examples:
             return 1
     
     except Exception as e:
-        print(f"Error during validation: {e}", file=sys.stderr)
-        import traceback
-        traceback.print_exc()
+        # Structured error for machine consumers; the stack is only
+        # formatted when --debug asks for it.
+        err = {
+            'passed': False,
+            'error': str(e),
+            'error_type': type(e).__name__,
+        }
+        if args.debug:
+            import traceback
+            err['traceback'] = traceback.format_exc()
+        print(json.dumps(err), file=sys.stderr)
         return 2
 
 
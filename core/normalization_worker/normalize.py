@@ -17,17 +17,61 @@ import os
 import sys
 import time
 import hashlib
+import uuid
 import psycopg2
-from psycopg2.extras import RealDictCursor
+from psycopg2.extras import RealDictCursor, execute_values
 import json
 import logging
 
+try:
+    import orjson  # Optional: C-accelerated JSON serialization
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    def _json_dumps(obj, sort_keys=False):
+        """Serialize to bytes in one C call."""
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS if sort_keys else 0)
+else:
+    def _json_dumps(obj, sort_keys=False):
+        """Serialize to bytes via stdlib json."""
+        return json.dumps(obj, sort_keys=sort_keys).encode('utf-8')
+
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s [%(levelname)s] %(message)s'
 )
 logger = logging.getLogger(__name__)
 
+# Digest used for deterministic keys and audit payload hashes. BLAKE2b
+# produces the same 32-byte output and is faster on CPUs without
+# SHA-NI; the default stays sha256 so existing rows keep verifying.
+# The audit chain hash itself is NOT switchable -- the schema stores it
+# as chain_hash_sha256 and external verifiers recompute SHA-256.
+_HASH_ALGO = os.environ.get('NORMALIZATION_HASH_ALGO', 'sha256').lower()
+if _HASH_ALGO == 'sha256':
+    def _payload_digest(data):
+        return hashlib.sha256(data).digest()
+elif _HASH_ALGO == 'blake2b':
+    def _payload_digest(data):
+        return hashlib.blake2b(data, digest_size=32).digest()
+elif _HASH_ALGO == 'blake3':
+    try:
+        import blake3
+    except ImportError:
+        # FAIL-CLOSED: the operator asked for blake3; don't silently
+        # fall back to a different algorithm
+        raise RuntimeError(
+            "NORMALIZATION_HASH_ALGO=blake3 requires the blake3 package")
+
+    def _payload_digest(data):
+        # 32-byte default output; the C extension releases the GIL and
+        # vectorizes internally (AVX2/AVX-512 where available)
+        return blake3.blake3(data).digest()
+else:
+    # FAIL-CLOSED: refuse to start with an unknown algorithm
+    raise RuntimeError(f"Unsupported NORMALIZATION_HASH_ALGO: {_HASH_ALGO}")
+
 def get_db_connection():
     """Get database connection from environment variables."""
     db_host = os.environ.get('DB_HOST', 'localhost')
@@ -46,6 +90,95 @@ def get_db_connection():
     conn.set_session(autocommit=False)
     return conn
 
+# In-memory copy of this worker's keyset watermark; loaded from
+# ransomeye.normalization_cursor on the first batch and advanced after
+# every successful commit.
+_watermark = None
+
+# Heartbeat throttle: the component row only needs a liveness touch
+# every so often, not three round trips and a commit per batch.
+_HEARTBEAT_INTERVAL = 30.0
+_last_heartbeat = 0.0
+
+def _maybe_heartbeat(cursor, component_id):
+    """Refresh last_heartbeat_at at most every _HEARTBEAT_INTERVAL.
+
+    Returns True when an UPDATE was issued so the caller knows the
+    transaction has pending work to commit.
+    """
+    global _last_heartbeat
+    now = time.monotonic()
+    if now - _last_heartbeat < _HEARTBEAT_INTERVAL:
+        return False
+    cursor.execute("""
+        UPDATE ransomeye.components
+        SET last_heartbeat_at = NOW()
+        WHERE component_id = %s
+    """, (component_id,))
+    _last_heartbeat = now
+    return True
+
+def ensure_normalization_cursor(conn):
+    """Create the keyset watermark table if it does not exist.
+
+    The watermark replaces the ever-growing NOT EXISTS anti-join with a
+    range scan on (received_at, raw_event_id).
+    """
+    cursor = conn.cursor()
+    try:
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS ransomeye.normalization_cursor (
+                component_id uuid PRIMARY KEY,
+                last_received_at timestamptz NOT NULL,
+                last_raw_event_id uuid NOT NULL
+            )
+        """)
+        conn.commit()
+    finally:
+        cursor.close()
+
+def prepare_statements(conn):
+    """Server-side PREPARE the per-poll statements once per connection.
+
+    The worker re-issues the same unprocessed-events scan and audit
+    chain-tail lookup on every poll; preparing them skips the repeated
+    parse/plan cost. The batched INSERTs stay on execute_values since
+    their row count varies per batch.
+    """
+    cursor = conn.cursor()
+    try:
+        cursor.execute("""
+            PREPARE norm_find_unprocessed(int) AS
+            SELECT re.raw_event_id, re.source_type, re.source_agent_id, re.source_component_id,
+                   re.observed_at, re.payload_json, re.received_at
+            FROM ransomeye.raw_events re
+            WHERE NOT EXISTS (
+                SELECT 1 FROM ransomeye.normalized_events ne
+                WHERE ne.raw_event_id = re.raw_event_id
+            )
+            ORDER BY re.received_at ASC, re.raw_event_id ASC
+            LIMIT $1
+        """)
+        cursor.execute("""
+            PREPARE norm_find_after(timestamptz, uuid, int) AS
+            SELECT re.raw_event_id, re.source_type, re.source_agent_id, re.source_component_id,
+                   re.observed_at, re.payload_json, re.received_at
+            FROM ransomeye.raw_events re
+            WHERE (re.received_at, re.raw_event_id) > ($1, $2)
+            ORDER BY re.received_at ASC, re.raw_event_id ASC
+            LIMIT $3
+        """)
+        cursor.execute("""
+            PREPARE norm_audit_tail AS
+            SELECT audit_id, chain_hash_sha256, payload_sha256
+            FROM ransomeye.immutable_audit_log
+            ORDER BY created_at DESC
+            LIMIT 1
+        """)
+        conn.commit()
+    finally:
+        cursor.close()
+
 def get_or_create_normalization_component(conn):
     """Get or create normalization component for audit attribution."""
     cursor = conn.cursor()
@@ -62,6 +195,7 @@ def get_or_create_normalization_component(conn):
             LIMIT 1
         """, (component_name, instance_id, instance_id))
         
+        global _last_heartbeat
         row = cursor.fetchone()
         if row:
             component_id = row[0]
@@ -72,6 +206,7 @@ def get_or_create_normalization_component(conn):
                 WHERE component_id = %s
             """, (component_id,))
             conn.commit()
+            _last_heartbeat = time.monotonic()
             return component_id
         
         # Create new component
@@ -83,71 +218,98 @@ def get_or_create_normalization_component(conn):
             VALUES (%s, 'core_engine'::component_type, %s, %s, NOW(), NOW())
         """, (component_id, component_name, instance_id))
         conn.commit()
+        _last_heartbeat = time.monotonic()
         return component_id
     finally:
         cursor.close()
 
-def insert_immutable_audit_log(conn, actor_component_id, actor_agent_id, action, object_type, 
-                               object_id, event_time, payload_json, payload_sha256):
-    """Insert into immutable_audit_log (fail-closed)."""
-    cursor = conn.cursor()
+def fetch_audit_chain_tail(cursor):
+    """Fetch the audit chain tail once per batch (fail-closed).
+
+    Returns (prev_audit_id, prev_chain_hash, prev_payload_sha256); the
+    genesis tail is 32 zero bytes when the log is empty.
+    """
+    cursor.execute("EXECUTE norm_audit_tail")
+    
+    row = cursor.fetchone()
+    if row:
+        return row['audit_id'], bytes(row['chain_hash_sha256']), row['payload_sha256']
+    return None, bytes(32), None
+
+def insert_audit_log_batch(cursor, audit_rows):
+    """Insert pre-chained audit rows in one statement (fail-closed).
+
+    The chain hashes are computed by the caller while building
+    audit_rows; this just writes the whole batch in a single
+    execute_values round trip.
+    """
+    execute_values(cursor, """
+        INSERT INTO ransomeye.immutable_audit_log (
+            audit_id, actor_component_id, actor_agent_id, action, object_type, object_id, event_time,
+            payload_json, payload_sha256, prev_audit_id, prev_payload_sha256, chain_hash_sha256, signature_status
+        )
+        VALUES %s
+    """, audit_rows,
+        template="(%s, %s, %s, %s, %s::text::trust_object_type, %s, %s, %s, %s, %s, %s, %s, 'unknown')",
+        page_size=500)
+
+_NORMALIZED_INSERT_SQL = """
+    INSERT INTO ransomeye.normalized_events (
+        raw_event_id, observed_at, source_type, source_agent_id, source_component_id,
+        event_kind, event_subkind, severity, attributes, deterministic_key
+    )
+    VALUES %s
+    RETURNING normalized_event_id, raw_event_id
+"""
+
+def _insert_normalized_events(cursor, insert_rows):
+    """Insert the batch of normalized events under a SAVEPOINT.
+
+    The fast path is one multi-row INSERT. If any row poisons it (e.g. a
+    constraint violation), roll back to the savepoint and retry the rows
+    one by one, each under its own savepoint, so a single bad event is
+    skipped (fail-closed per event) instead of aborting the whole batch's
+    transaction. Returns the RETURNING rows for the events that made it in.
+    """
+    cursor.execute("SAVEPOINT norm_batch")
     try:
-        # Get previous audit chain entry for hash chaining
-        cursor.execute("""
-            SELECT audit_id, chain_hash_sha256, payload_sha256
-            FROM ransomeye.immutable_audit_log
-            ORDER BY created_at DESC
-            LIMIT 1
-        """)
-        
-        row = cursor.fetchone()
-        if row:
-            prev_audit_id = row[0]
-            prev_chain_hash = row[1]
-            prev_payload_sha256 = row[2]
-        else:
-            prev_audit_id = None
-            prev_chain_hash = bytes(32)  # 32 zero bytes
-            prev_payload_sha256 = None
-        
-        # Compute chain hash: SHA256(prev_chain_hash || payload_sha256)
-        chain_input = prev_chain_hash + payload_sha256
-        chain_hash_sha256 = hashlib.sha256(chain_input).digest()
-        
-        # Insert audit log entry
-        import uuid
-        audit_id = uuid.uuid4()
-        cursor.execute("""
-            INSERT INTO ransomeye.immutable_audit_log (
-                audit_id, actor_component_id, actor_agent_id, action, object_type, object_id, event_time,
-                payload_json, payload_sha256, prev_audit_id, prev_payload_sha256, chain_hash_sha256, signature_status
-            )
-            VALUES (%s, %s, %s, %s, %s::text::trust_object_type, %s, %s, %s, %s, %s, %s, %s, 'unknown')
-            RETURNING audit_id
-        """, (
-            audit_id,
-            actor_component_id,
-            actor_agent_id,
-            action,
-            object_type,
-            object_id,
-            event_time,
-            json.dumps(payload_json),
-            payload_sha256,
-            prev_audit_id,
-            prev_payload_sha256,
-            chain_hash_sha256,
-        ))
-        
-        result = cursor.fetchone()
-        return result[0] if result else audit_id
-    finally:
-        cursor.close()
+        returned = execute_values(cursor, _NORMALIZED_INSERT_SQL,
+                                  insert_rows, page_size=500, fetch=True)
+        cursor.execute("RELEASE SAVEPOINT norm_batch")
+        return returned
+    except Exception as e:
+        cursor.execute("ROLLBACK TO SAVEPOINT norm_batch")
+        logger.warning(f"Batched normalized_events INSERT failed ({e}); "
+                       f"retrying rows individually")
+
+    returned = []
+    for row in insert_rows:
+        cursor.execute("SAVEPOINT ev")
+        try:
+            cursor.execute(_NORMALIZED_INSERT_SQL.replace(
+                "VALUES %s", "VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)"), row)
+            returned.append(cursor.fetchone())
+            cursor.execute("RELEASE SAVEPOINT ev")
+        except Exception as e:
+            cursor.execute("ROLLBACK TO SAVEPOINT ev")
+            logger.error(f"FAIL-CLOSED: Failed to insert normalized event for raw_event_id={row[0]}: {e}")
+    return returned
+
+def _advance_watermark(cursor, component_id, watermark):
+    """Upsert the keyset watermark row for this component."""
+    cursor.execute("""
+        INSERT INTO ransomeye.normalization_cursor
+            (component_id, last_received_at, last_raw_event_id)
+        VALUES (%s, %s, %s)
+        ON CONFLICT (component_id) DO UPDATE
+        SET last_received_at = EXCLUDED.last_received_at,
+            last_raw_event_id = EXCLUDED.last_raw_event_id
+    """, (component_id, watermark[0], watermark[1]))
 
 def compute_deterministic_key(raw_event_id, source_type, event_kind, observed_at_str):
-    """Compute deterministic key from normalized fields (SHA-256, 32 bytes)."""
+    """Compute deterministic key from normalized fields (32 bytes)."""
     key_data = f"{raw_event_id}|{source_type}|{event_kind}|{observed_at_str or ''}"
-    return hashlib.sha256(key_data.encode('utf-8')).digest()
+    return _payload_digest(key_data.encode('utf-8'))
 
 def extract_event_kind(payload_json):
     """Extract event_kind from payload (required field)."""
@@ -225,63 +387,109 @@ def normalize_event(raw_event):
         'deterministic_key': deterministic_key,
     }
 
-def process_batch(conn, batch_size=100):
-    """Process a batch of unprocessed raw_events."""
+def process_batch(conn, component_id, batch_size=100):
+    """Process a batch of unprocessed raw_events.
+
+    component_id is resolved once at startup (PROMPT-40A audit
+    attribution); the hot loop no longer re-fetches it per batch.
+    """
     cursor = conn.cursor(cursor_factory=RealDictCursor)
     
+    global _watermark
+    
     try:
-        # Find raw_events that don't have corresponding normalized_events (idempotency)
-        cursor.execute("""
-            SELECT re.raw_event_id, re.source_type, re.source_agent_id, re.source_component_id,
-                   re.observed_at, re.payload_json
-            FROM ransomeye.raw_events re
-            WHERE NOT EXISTS (
-                SELECT 1 FROM ransomeye.normalized_events ne
-                WHERE ne.raw_event_id = re.raw_event_id
-            )
-            ORDER BY re.received_at ASC
-            LIMIT %s
-        """, (batch_size,))
+        normalization_component_id = component_id
+        
+        # Find the next batch via the keyset watermark; the NOT EXISTS
+        # anti-join only runs once, to initialise the marker. Both
+        # statements are prepared at startup.
+        if _watermark is None:
+            cursor.execute("""
+                SELECT last_received_at, last_raw_event_id
+                FROM ransomeye.normalization_cursor
+                WHERE component_id = %s
+            """, (normalization_component_id,))
+            row = cursor.fetchone()
+            if row:
+                _watermark = (row['last_received_at'], row['last_raw_event_id'])
+        
+        if _watermark is not None:
+            cursor.execute("EXECUTE norm_find_after(%s, %s, %s)",
+                           (_watermark[0], _watermark[1], batch_size))
+        else:
+            cursor.execute("EXECUTE norm_find_unprocessed(%s)", (batch_size,))
         
         raw_events = cursor.fetchall()
         
         if not raw_events:
+            # Keep the component's liveness fresh while idle
+            if _maybe_heartbeat(cursor, normalization_component_id):
+                conn.commit()
             return 0
         
         logger.info(f"Processing {len(raw_events)} raw_events for normalization")
         
-        # PROMPT-40A: Get normalization component for audit attribution
-        normalization_component_id = get_or_create_normalization_component(conn)
+        # The watermark advances over every scanned row (including ones
+        # that fail normalization -- those are logged and not retried,
+        # matching the fail-closed skip the old loop performed).
+        last_row = raw_events[-1]
+        new_watermark = (last_row['received_at'], last_row['raw_event_id'])
         
         normalized_count = 0
         error_count = 0
         
+        # Phase 1: normalize in Python. A bad event is logged and skipped
+        # (fail-closed per event) without losing the rest of the batch.
+        normalized_events = []
         for raw_event in raw_events:
             try:
-                normalized = normalize_event(raw_event)
-                
-                # Insert into normalized_events
-                cursor.execute("""
-                    INSERT INTO ransomeye.normalized_events (
-                        raw_event_id, observed_at, source_type, source_agent_id, source_component_id,
-                        event_kind, event_subkind, severity, attributes, deterministic_key
-                    )
-                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                    RETURNING normalized_event_id
-                """, (
-                    normalized['raw_event_id'],
-                    normalized['observed_at'],
-                    normalized['source_type'],
-                    normalized['source_agent_id'],
-                    normalized['source_component_id'],
-                    normalized['event_kind'],
-                    normalized['event_subkind'],
-                    normalized['severity'],
-                    json.dumps(normalized['attributes']) if normalized['attributes'] else None,
-                    normalized['deterministic_key'],
-                ))
-                
-                normalized_event_id = cursor.fetchone()[0]
+                normalized_events.append(normalize_event(raw_event))
+            except Exception as e:
+                error_count += 1
+                logger.error(f"FAIL-CLOSED: Failed to normalize raw_event_id={raw_event['raw_event_id']}: {e}")
+        
+        if not normalized_events:
+            _advance_watermark(cursor, normalization_component_id, new_watermark)
+            conn.commit()
+            _watermark = new_watermark
+            return 0
+        
+        # Phase 2: one multi-row INSERT for the whole batch instead of a
+        # round trip per event.
+        insert_rows = [
+            (
+                normalized['raw_event_id'],
+                normalized['observed_at'],
+                normalized['source_type'],
+                normalized['source_agent_id'],
+                normalized['source_component_id'],
+                normalized['event_kind'],
+                normalized['event_subkind'],
+                normalized['severity'],
+                _json_dumps(normalized['attributes']).decode('utf-8') if normalized['attributes'] else None,
+                normalized['deterministic_key'],
+            )
+            for normalized in normalized_events
+        ]
+        returned = _insert_normalized_events(cursor, insert_rows)
+        error_count += len(insert_rows) - len(returned)
+        
+        normalized_event_ids = {
+            row['raw_event_id']: row['normalized_event_id'] for row in returned
+        }
+        
+        # Phase 3: extend the audit hash chain in Python and write it in
+        # one statement; the chain tail is read once per batch instead of
+        # once per event.
+        prev_audit_id, prev_chain_hash, prev_payload_sha256 = fetch_audit_chain_tail(cursor)
+        audit_rows = []
+        for normalized in normalized_events:
+            if normalized['raw_event_id'] not in normalized_event_ids:
+                # Row was skipped by the per-event savepoint fallback;
+                # its failure is already logged and counted.
+                continue
+            try:
+                normalized_event_id = normalized_event_ids[normalized['raw_event_id']]
                 
                 # PROMPT-40A: Audit NORMALIZED_EVENT_INSERT (after successful normalized_events INSERT)
                 normalized_payload = {
@@ -295,30 +503,55 @@ def process_batch(conn, batch_size=100):
                     "observed_at": normalized['observed_at'].isoformat() if normalized['observed_at'] else None,
                     "deterministic_key": normalized['deterministic_key'].hex() if isinstance(normalized['deterministic_key'], bytes) else normalized['deterministic_key']
                 }
-                normalized_payload_str = json.dumps(normalized_payload, sort_keys=True)
-                normalized_payload_sha256 = hashlib.sha256(normalized_payload_str.encode()).digest()
+                # One serialization feeds both the digest and the DB
+                # param; jsonb normalizes key order anyway, so storing
+                # the sorted form changes nothing semantically.
+                normalized_payload_bytes = _json_dumps(normalized_payload, sort_keys=True)
+                normalized_payload_sha256 = _payload_digest(normalized_payload_bytes)
+                
+                # Chain hash: SHA256(prev_chain_hash || payload_sha256)
+                audit_id = uuid.uuid4()
+                chain_hash_sha256 = hashlib.sha256(
+                    prev_chain_hash + normalized_payload_sha256).digest()
                 
-                insert_immutable_audit_log(
-                    conn,
+                audit_rows.append((
+                    audit_id,
                     normalization_component_id,
                     normalized['source_agent_id'],
                     "NORMALIZED_EVENT_INSERT",
                     "normalized_event",
                     normalized_event_id,
                     normalized['observed_at'],
-                    normalized_payload,
+                    normalized_payload_bytes.decode('utf-8'),
                     normalized_payload_sha256,
-                )
+                    prev_audit_id,
+                    prev_payload_sha256,
+                    chain_hash_sha256,
+                ))
+                
+                # Advance the chain tail for the next event in the batch
+                prev_audit_id = audit_id
+                prev_chain_hash = chain_hash_sha256
+                prev_payload_sha256 = normalized_payload_sha256
                 
                 normalized_count += 1
                 
             except Exception as e:
                 error_count += 1
-                logger.error(f"FAIL-CLOSED: Failed to normalize raw_event_id={raw_event['raw_event_id']}: {e}")
+                logger.error(f"FAIL-CLOSED: Failed to audit raw_event_id={normalized['raw_event_id']}: {e}")
                 # Continue processing other events, but log the error
         
+        if audit_rows:
+            insert_audit_log_batch(cursor, audit_rows)
+
+        # Persist the advanced watermark in the same transaction, and
+        # piggyback the periodic heartbeat on the batch's commit
+        _advance_watermark(cursor, normalization_component_id, new_watermark)
+        _maybe_heartbeat(cursor, normalization_component_id)
+
         # Commit batch
         conn.commit()
+        _watermark = new_watermark
         
         if normalized_count > 0:
             logger.info(f"Normalized {normalized_count} events (errors: {error_count})")
@@ -343,13 +576,22 @@ def main():
     conn.commit()
     cursor.close()
     
+    # Create the watermark table and prepare the hot statements on
+    # this long-lived connection
+    ensure_normalization_cursor(conn)
+    prepare_statements(conn)
+    
+    # PROMPT-40A: resolve the audit-attribution component once; its id
+    # never changes for the lifetime of the worker
+    component_id = get_or_create_normalization_component(conn)
+    
     batch_size = int(os.environ.get('NORMALIZATION_BATCH_SIZE', '100'))
     poll_interval = float(os.environ.get('NORMALIZATION_POLL_INTERVAL', '1.0'))
     
     try:
         while True:
             try:
-                processed = process_batch(conn, batch_size)
+                processed = process_batch(conn, component_id, batch_size)
                 
                 if processed == 0:
                     # No new events, sleep before next poll